@@ -0,0 +1,174 @@
+function createBagCard(bagNumber) {
+    return `
+        <div class="bag-spec-card" data-bag-id="${bagNumber}">
+            <div class="bag-spec-header">
+                <div class="bag-spec-number">🛍️ Bag Specification #${bagNumber}</div>
+            </div>
+            <div class="form-group">
+                <label>Select Bag Type *</label>
+                <div class="bag-type-selection">
+                    <label class="bag-type-card" data-bag="${bagNumber}" data-type="collar">
+                        <input type="radio" name="bag_type_${bagNumber}" value="collar">
+                        {{ image_tag('collar.webp', 'Collar', '(max-width: 768px) 90vw, 260px', 'bag-type-img') }}
+                        <div class="bag-type-name">⭕ Collar</div>
+                        <div class="bag-type-desc">Collar Type</div>
+                    </label>
+                    <label class="bag-type-card" data-bag="${bagNumber}" data-type="snap">
+                        <input type="radio" name="bag_type_${bagNumber}" value="snap">
+                        {{ image_tag('snap-ring.jpeg', 'Snap', '(max-width: 768px) 90vw, 260px', 'bag-type-img') }}
+                        <div class="bag-type-name">📌 Snap</div>
+                        <div class="bag-type-desc">Snap Type</div>
+                    </label>
+                    <label class="bag-type-card" data-bag="${bagNumber}" data-type="ring">
+                        <input type="radio" name="bag_type_${bagNumber}" value="ring">
+                        <div class="ring-image-container">
+                            {{ image_tag('GI.jpeg', 'Steel Ring', '120px') }}
+                        </div>
+                        <div class="bag-type-name">Ring</div>
+                        <div class="bag-type-desc">Ring Type</div>
+                    </label>
+                </div>
+            </div>
+            <div id="collarFields_${bagNumber}" class="conditional-section">
+                <h3 style="margin-bottom:15px;color:#1f3c88;">⭕ Collar Type Specifications</h3>
+                <div class="form-group">
+                    <label>Collar OD (Outer Diameter) *</label>
+                    <input type="text" id="collarOD_${bagNumber}" list="collarSizes_${bagNumber}" placeholder="Enter or select size (e.g. 150mm)">
+                    <datalist id="collarSizes_${bagNumber}"></datalist>
+                </div>
+                <div class="form-group">
+                    <label>Collar ID (Inner Diameter) *</label>
+                    <input type="text" id="collarID_${bagNumber}" list="collarSizes_${bagNumber}" placeholder="Enter or select size (e.g. 140mm)">
+                </div>
+            </div>
+            <div id="snapFields_${bagNumber}" class="conditional-section">
+                <h3 style="margin-bottom:15px;color:#1f3c88;">📌 Snap Type Specifications</h3>
+                <div class="form-group">
+                    <label>Tubesheet Data *</label>
+                    <div class="field-with-image">
+                        <div class="field-wrapper">
+                            <input type="text" id="tubesheetData_${bagNumber}" list="snapSizes_${bagNumber}" placeholder="Enter or select size">
+                            <datalist id="snapSizes_${bagNumber}"></datalist>
+                        </div>
+                        {{ image_tag('tubesheet.jpeg', 'Tubesheet Reference', '(max-width: 768px) 200px, 120px', 'reference-image') }}
+                    </div>
+                </div>
+            </div>
+            <div id="ringFields_${bagNumber}" class="conditional-section">
+                <h3 style="margin-bottom:15px;color:#1f3c88;">Ring Type Specifications</h3>
+                <div class="form-group">
+                    <label>Tubesheet Diameter *</label>
+                    <div class="field-with-image">
+                        <div class="field-wrapper">
+                            <input type="text" id="tubesheetDia_${bagNumber}" list="ringSizes_${bagNumber}" placeholder="Enter or select diameter">
+                            <datalist id="ringSizes_${bagNumber}"></datalist>
+                        </div>
+                        {{ image_tag('tubesheet.jpeg', 'Tubesheet Reference', '(max-width: 768px) 200px, 120px', 'reference-image') }}
+                    </div>
+                </div>
+            </div>
+        </div>
+    `;
+}
+
+function attachBagTypeListeners(bagNumber) {
+    const cards = document.querySelectorAll(`[data-bag="${bagNumber}"]`);
+    cards.forEach(card => {
+        card.addEventListener('click', function() {
+            cards.forEach(c => c.classList.remove('selected'));
+            this.classList.add('selected');
+            const radio = this.querySelector('input[type="radio"]');
+            radio.checked = true;
+            ['collar','snap','ring'].forEach(t => document.getElementById(`${t}Fields_${bagNumber}`).classList.remove('active'));
+            document.getElementById(`${radio.value}Fields_${bagNumber}`).classList.add('active');
+            loadBagSizes(bagNumber, radio.value);
+        });
+    });
+}
+
+// Poora size catalog ek hi request mein — bag card / type switch pe dobara network nahi
+const sizeCatalog = fetch('/api/sizes').then(r => r.json());
+
+async function loadBagSizes(bagNumber, bagType) {
+    try {
+        const d = await sizeCatalog;
+        if (!d.success) return;
+        const sizes = d.sizes[bagType] || [];
+        const dlId = bagType === 'collar' ? `collarSizes_${bagNumber}` : bagType === 'snap' ? `snapSizes_${bagNumber}` : `ringSizes_${bagNumber}`;
+        const dl = document.getElementById(dlId);
+        if (dl) dl.innerHTML = sizes.map(s => `<option value="${s.size_name}"></option>`).join('');
+    } catch(e) { console.error('Error loading sizes:', e); }
+}
+
+document.getElementById('specForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const btn = document.getElementById('submitBtn');
+    const messageDiv = document.getElementById('message');
+    const loadingOverlay = document.getElementById('loadingOverlay');
+    const bags = [];
+    const bagCards = document.querySelectorAll('.bag-spec-card');
+    const clientName = document.getElementById('clientNameInput').value.trim();
+    if (!clientName) { showMessage("Please enter your Name", "error"); return; }
+
+    for (let card of bagCards) {
+        const bagId = card.getAttribute('data-bag-id');
+        const selectedRadio = document.querySelector(`input[name="bag_type_${bagId}"]:checked`);
+        if (!selectedRadio) { showMessage(`Please select a bag type for Bag #${bagId}`, 'error'); return; }
+        const bagType = selectedRadio.value;
+        let bagData = { bag_type: bagType, client_name: clientName };
+        if (bagType === 'collar') {
+            const od = document.getElementById(`collarOD_${bagId}`).value.trim();
+            const id = document.getElementById(`collarID_${bagId}`).value.trim();
+            if (!od || !id) { showMessage(`Please fill Collar OD and ID for Bag #${bagId}`, 'error'); return; }
+            bagData.collar_od = od; bagData.collar_id = id;
+        } else if (bagType === 'snap') {
+            const ts = document.getElementById(`tubesheetData_${bagId}`).value.trim();
+            if (!ts) { showMessage(`Please provide Tubesheet Data for Bag #${bagId}`, 'error'); return; }
+            bagData.tubesheet_data = ts;
+        } else if (bagType === 'ring') {
+            const dia = document.getElementById(`tubesheetDia_${bagId}`).value.trim();
+            if (!dia) { showMessage(`Please provide Tubesheet Diameter for Bag #${bagId}`, 'error'); return; }
+            bagData.tubesheet_dia = dia;
+        }
+        bags.push(bagData);
+    }
+
+    btn.disabled = true; btn.textContent = '⏳ Submitting...';
+    loadingOverlay.classList.add('active'); messageDiv.style.display = 'none';
+
+    try {
+        const r = await fetch(`/api/submit-form/${e.target.dataset.token}`, {
+            method: 'POST', headers: {'Content-Type':'application/json'},
+            body: JSON.stringify({bags, global_remarks: document.getElementById('globalRemarks').value || null})
+        });
+        const d = await r.json();
+        loadingOverlay.classList.remove('active');
+        if (d.success) {
+            document.querySelector('.content').innerHTML = `
+                <div style="text-align:center;padding:60px 20px;">
+                    <div style="font-size:4rem;margin-bottom:20px;">✅</div>
+                    <h2 style="color:#28a745;margin-bottom:10px;">Thank You!</h2>
+                    <p style="color:#555;font-size:1.1em;">Your filter bag specification has been submitted successfully.</p>
+                </div>`;
+        } else {
+            showMessage('❌ ' + d.message, 'error');
+            btn.disabled = false; btn.textContent = '📩 Submit All Specifications';
+        }
+    } catch(err) {
+        loadingOverlay.classList.remove('active');
+        showMessage('❌ Error: ' + err.message, 'error');
+        btn.disabled = false; btn.textContent = '📩 Submit All Specifications';
+    }
+});
+
+function showMessage(text, type) {
+    const md = document.getElementById('message');
+    md.style.display = 'block'; md.className = `message ${type}`; md.innerHTML = text;
+    md.scrollIntoView({behavior:'smooth', block:'nearest'});
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const container = document.getElementById('bagSpecsContainer');
+    container.innerHTML = createBagCard(1);
+    attachBagTypeListeners(1);
+});
@@ -0,0 +1,156 @@
+function switchTab(tab, event) {
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+    event.target.classList.add('active');
+    document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+    if (tab === 'email') document.getElementById('emailTab').classList.add('active');
+    else if (tab === 'bulk') document.getElementById('bulkTab').classList.add('active');
+    else if (tab === 'link') document.getElementById('linkTab').classList.add('active');
+    else if (tab === 'sizes') { document.getElementById('sizesTab').classList.add('active'); loadSizes(); }
+}
+
+document.getElementById('emailForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const btn = document.getElementById('sendBtn');
+    const msg = document.getElementById('emailMessage');
+    btn.disabled = true; btn.textContent = 'Sending email...'; msg.style.display = 'none';
+    try {
+        const r = await fetch('/api/send-form', { method: 'POST', headers: {'Content-Type':'application/json'},
+            body: JSON.stringify({
+                recipient_email: document.getElementById('recipientEmail').value,
+                po_number: document.getElementById('poNumber').value,
+                admin_quantity: document.getElementById('adminQuantity').value,
+                admin_size: document.getElementById('adminSize').value
+            })});
+        const d = await r.json();
+        msg.style.display = 'block';
+        msg.className = 'message ' + (d.success ? 'success' : 'error');
+        msg.innerHTML = (d.success ? '✅ ' : '❌ ') + d.message;
+        if (d.success) { document.getElementById('emailForm').reset(); document.getElementById('poNumber').value=''; document.getElementById('adminQuantity').value=''; document.getElementById('adminSize').value=''; }
+    } catch(err) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ '+err.message; }
+    finally { btn.disabled=false; btn.textContent='🚀 Send Form Link'; }
+});
+
+document.getElementById('linkForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const btn = document.getElementById('generateBtn');
+    const msg = document.getElementById('linkMessage');
+    const linkDiv = document.getElementById('generatedLink');
+    btn.disabled=true; btn.textContent='Generating link...'; msg.style.display='none'; linkDiv.style.display='none';
+    try {
+        const r = await fetch('/api/generate-link', { method:'POST', headers:{'Content-Type':'application/json'},
+            body: JSON.stringify({
+                po_number: document.getElementById('poNumberLink').value,
+                admin_quantity: document.getElementById('adminQuantityLink').value,
+                admin_size: document.getElementById('adminSizeLink').value
+            })});
+        const d = await r.json();
+        msg.style.display='block'; msg.className='message '+(d.success?'success':'error'); msg.innerHTML=(d.success?'✅ ':'❌ ')+d.message;
+        if (d.success) { document.getElementById('linkUrl').textContent=d.form_url; linkDiv.style.display='block'; }
+    } catch(err) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ '+err.message; }
+    finally { btn.disabled=false; btn.textContent='🔗 Generate Form Link'; }
+});
+
+document.getElementById('bulkForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const btn = document.getElementById('bulkBtn');
+    const msg = document.getElementById('bulkMessage');
+    const fileInput = document.getElementById('bulkFile');
+    const csvText = document.getElementById('bulkCsv').value.trim();
+    if (!fileInput.files.length && !csvText) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ Please paste or upload a CSV'; return; }
+    const fd = new FormData();
+    fd.append('file', fileInput.files.length ? fileInput.files[0] : new Blob([csvText], {type:'text/csv'}), 'recipients.csv');
+    fd.append('po_number', document.getElementById('poNumberBulk').value);
+    fd.append('admin_quantity', document.getElementById('adminQuantityBulk').value);
+    fd.append('admin_size', document.getElementById('adminSizeBulk').value);
+    btn.disabled=true; btn.textContent='Queueing...'; msg.style.display='none';
+    try {
+        const r = await fetch('/api/send-form/bulk', {method:'POST', body: fd});
+        const d = await r.json();
+        msg.style.display='block'; msg.className='message '+(d.success?'success':'error'); msg.innerHTML=(d.success?'✅ ':'❌ ')+d.message;
+        renderBulkResults(d.results || []);
+        if (d.campaign_id) pollBulkProgress(d.campaign_id);
+    } catch(err) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ '+err.message; }
+    finally { btn.disabled=false; btn.textContent='📨 Queue Form Links'; }
+});
+
+function renderBulkResults(results) {
+    // CSV se aayi values — textContent, innerHTML nahi
+    const icon = {queued:'⏳', sent:'✅', failed:'❌', invalid:'⚠️', pending:'⏳'};
+    const table = document.getElementById('bulkResults');
+    table.innerHTML = '<tr><th>#</th><th>Recipient</th><th>Status</th></tr>';
+    results.forEach(x => {
+        const tr = table.insertRow();
+        tr.insertCell().textContent = x.row;
+        tr.insertCell().textContent = x.recipient_email || '-';
+        const status = tr.insertCell();
+        if (x.outbox_id) status.id = 'outbox-' + x.outbox_id;
+        status.textContent = `${icon[x.status] || ''} ${x.status}${x.message ? ' — ' + x.message : ''}`;
+    });
+}
+
+async function pollBulkProgress(campaignId) {
+    const wrap = document.getElementById('bulkProgressWrap');
+    const bar = document.getElementById('bulkProgress');
+    const text = document.getElementById('bulkProgressText');
+    wrap.style.display = 'block';
+    try {
+        const d = await (await fetch(`/api/send-form/bulk/${campaignId}`)).json();
+        if (!d.success) return;
+        const finished = d.counts.sent + d.counts.failed;
+        bar.style.width = (finished / d.total * 100) + '%';
+        text.textContent = `${d.counts.sent} sent, ${d.counts.pending} pending, ${d.counts.failed} failed of ${d.total}`;
+        d.emails.forEach(m => {
+            const cell = document.getElementById('outbox-' + m.outbox_id);
+            if (cell) cell.textContent = (m.status === 'sent' ? '✅ ' : m.status === 'failed' ? '❌ ' : '⏳ ') + m.status;
+        });
+        if (!d.done) setTimeout(() => pollBulkProgress(campaignId), 2000);
+    } catch(err) { setTimeout(() => pollBulkProgress(campaignId), 5000); }
+}
+
+function copyLink() { navigator.clipboard.writeText(document.getElementById('linkUrl').textContent).then(()=>{alert('✅ Link copied to clipboard!');}); }
+
+document.getElementById('sizeForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    const btn = document.getElementById('addSizeBtn');
+    const msg = document.getElementById('sizeMessage');
+    const bagType = document.getElementById('bagTypeSelect').value;
+    const sizeName = document.getElementById('sizeName').value;
+    if (!bagType || !sizeName) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ Please fill all fields'; return; }
+    btn.disabled=true; btn.textContent='Adding...'; msg.style.display='none';
+    try {
+        const r = await fetch('/api/sizes', { method:'POST', headers:{'Content-Type':'application/json'}, body:JSON.stringify({bag_type:bagType,size_name:sizeName})});
+        const d = await r.json();
+        msg.style.display='block'; msg.className='message '+(d.success?'success':'error'); msg.innerHTML=(d.success?'✅ ':'❌ ')+d.message;
+        if (d.success) { document.getElementById('sizeForm').reset(); if(document.getElementById('filterBagType').value===bagType) loadSizes(); }
+    } catch(err) { msg.style.display='block'; msg.className='message error'; msg.innerHTML='❌ '+err.message; }
+    finally { btn.disabled=false; btn.textContent='➕ Add Size'; }
+});
+
+async function loadSizes() {
+    const bagType = document.getElementById('filterBagType').value;
+    const list = document.getElementById('sizesList');
+    list.innerHTML='<p style="text-align:center;color:#999;">Loading...</p>';
+    try {
+        const r = await fetch(`/api/sizes/${bagType}`);
+        const d = await r.json();
+        if (d.success && d.sizes.length > 0) {
+            list.innerHTML = d.sizes.map(s => `
+                <div style="display:flex;justify-content:space-between;align-items:center;padding:12px 15px;background:#f8f9ff;border-radius:8px;margin-bottom:10px;border:1px solid #ddd;">
+                    <span style="font-weight:500;color:#333;">${s.size_name}</span>
+                    <button onclick="deleteSize(${s.id},'${s.size_name}')" style="background:#dc3545;color:white;border:none;padding:6px 15px;border-radius:5px;cursor:pointer;font-size:14px;">🗑️ Delete</button>
+                </div>`).join('');
+        } else { list.innerHTML='<p style="text-align:center;color:#999;padding:30px;">No sizes added yet for this bag type.</p>'; }
+    } catch(err) { list.innerHTML=`<p style="text-align:center;color:#dc3545;">Error: ${err.message}</p>`; }
+}
+
+async function deleteSize(sizeId, sizeName) {
+    if (!confirm(`Delete size "${sizeName}"?`)) return;
+    const r = await fetch(`/api/sizes/${sizeId}`, {method:'DELETE'});
+    const d = await r.json();
+    if (d.success) {
+        loadSizes();
+        const msg = document.getElementById('sizeMessage');
+        msg.style.display='block'; msg.className='message success'; msg.innerHTML=`✅ Size "${sizeName}" deleted successfully`;
+        setTimeout(()=>{msg.style.display='none';},3000);
+    } else { alert(`Error: ${d.message}`); }
+}
@@ -0,0 +1,29 @@
+const loadMoreBtn = document.getElementById('loadMoreBtn');
+if (loadMoreBtn) loadMoreBtn.addEventListener('click', async () => {
+    loadMoreBtn.disabled = true; loadMoreBtn.textContent = 'Loading...';
+    const params = new URLSearchParams(window.location.search);
+    params.set('cursor', loadMoreBtn.dataset.cursor); params.set('partial', '1');
+    try {
+        const d = await (await fetch('/submissions?' + params)).json();
+        document.getElementById('submissionCards').insertAdjacentHTML('beforeend', d.html);
+        if (d.next_cursor) { loadMoreBtn.dataset.cursor = d.next_cursor; }
+        else { loadMoreBtn.remove(); return; }
+    } catch(err) { alert('Error: ' + err.message); }
+    loadMoreBtn.disabled = false; loadMoreBtn.textContent = '⬇️ Load More';
+});
+
+// Earlier versions of a form link — sirf click pe fetch, dobara click pe toggle
+document.addEventListener('click', async (e) => {
+    const btn = e.target.closest('.history-btn');
+    if (!btn) return;
+    const box = btn.nextElementSibling;
+    if (btn.dataset.loaded) { box.hidden = !box.hidden; return; }
+    btn.disabled = true; btn.textContent = 'Loading...';
+    try {
+        const d = await (await fetch(`/submissions/${encodeURIComponent(btn.dataset.token)}/history`)).json();
+        if (!d.success) throw new Error(d.message);
+        box.innerHTML = d.count ? d.html : '<p class="history-empty">No earlier versions — this is the first submission.</p>';
+        box.hidden = false; btn.dataset.loaded = '1';
+    } catch(err) { alert('Error: ' + err.message); }
+    btn.disabled = false; btn.textContent = '🕘 Earlier versions';
+});
@@ -0,0 +1,88 @@
+"""
+Cold start - wall time from launching gunicorn to the first request served
+Runs against a throwaway SQLite database that is migrated once beforehand (as a release step would).
+
+    python benchmarks/bench_cold_start.py --runs 5 --workers 2
+    python benchmarks/bench_cold_start.py --runs 5 --workers 2 --preload
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url, deadline):
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            time.sleep(0.01)
+    return False
+
+
+def cold_start(args, env):
+    port = free_port()
+    cmd = [sys.executable, '-m', 'gunicorn', args.app, '--bind', f'127.0.0.1:{port}',
+           '--workers', str(args.workers), '--log-level', 'warning']
+    if args.preload:
+        cmd.append('--preload')
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if not wait_for(f'http://127.0.0.1:{port}{args.path}', start + args.timeout):
+            raise SystemExit(f'no response from {args.app} within {args.timeout}s')
+        return time.perf_counter() - start
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def import_time(env):
+    code = ('import time; t = time.perf_counter(); import filter_bag_app as m; '
+            'getattr(m, "create_app", lambda: None)(); print(time.perf_counter() - t)')
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gunicorn cold start to first request')
+    parser.add_argument('--app', default='filter_bag_app:create_app()')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--preload', action='store_true')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--path', default='/admin/login')
+    parser.add_argument('--timeout', type=float, default=60)
+    args = parser.parse_args()
+
+    db_path = os.path.join(tempfile.mkdtemp(), 'cold_start.db')
+    env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}')
+    # Release step: schema once per deploy (older trees migrate on import instead)
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'filter_bag_app', 'db-upgrade'],
+                   cwd=ROOT, env=env, capture_output=True)
+
+    imports = [import_time(env) for _ in range(args.runs)]
+    starts = [cold_start(args, env) for _ in range(args.runs)]
+    mode = 'preload' if args.preload else 'no preload'
+    print(f"import + app setup : median {statistics.median(imports) * 1000:7.0f} ms")
+    print(f"first request      : median {statistics.median(starts) * 1000:7.0f} ms  "
+          f"(min {min(starts) * 1000:.0f}, max {max(starts) * 1000:.0f}; {args.workers} workers, {mode})")
+
+
+if __name__ == '__main__':
+    main()
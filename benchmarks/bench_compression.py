@@ -0,0 +1,56 @@
+"""
+Response compression - bytes on the wire and CPU cost per page for identity / gzip / brotli
+"compress µs" is a cold compression at the per-request level; "cached µs" is a repeat of the same
+body served from the in-memory memo (sha1 + lookup). Bundles are precompressed once at startup.
+
+    python benchmarks/bench_compression.py --iterations 200 --rows 10
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from flask import render_template
+import filter_bag_app as fba
+from report_page_size import app, sample_pages
+
+
+def bench(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compression bytes and CPU per page')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=10, help='submission cards on /submissions')
+    args = parser.parse_args()
+
+    with app.test_request_context('/'):
+        bodies = {name: render_template(name, **ctx).encode() for name, ctx in sample_pages(args.rows).items()}
+
+    print(f"{'page':<18} {'identity B':>10} {'gzip B':>8} {'br B':>8} "
+          f"{'gzip µs':>8} {'br µs':>8} {'cached µs':>9}")
+    for name, data in bodies.items():
+        sizes = {enc: len(fba.compress(data, enc)) for enc in ('gzip', 'br')}
+        cost = {enc: bench(lambda: fba.compress(data, enc), args.iterations) for enc in ('gzip', 'br')}
+        cached = bench(lambda: fba.cached_compress(data, 'br'), args.iterations)
+        print(f"{name:<18} {len(data):>10,} {sizes['gzip']:>8,} {sizes['br']:>8,} "
+              f"{cost['gzip']:>8.1f} {cost['br']:>8.1f} {cached:>9.1f}")
+
+    print(f"\n{'bundle (precompressed)':<34} {'identity B':>10} {'gzip B':>8} {'br B':>8}")
+    for filename in sorted(fba.BUNDLES.values()):
+        size = os.path.getsize(os.path.join(fba.ASSET_DIST_DIR, filename))
+        gz, br = (len(fba.PRECOMPRESSED[(filename, enc)]) for enc in ('gzip', 'br'))
+        print(f"{filename:<34} {size:>10,} {gz:>8,} {br:>8,}")
+
+
+if __name__ == '__main__':
+    main()
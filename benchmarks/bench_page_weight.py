@@ -0,0 +1,71 @@
+"""
+Client form image weight - original /static files vs. the fingerprinted AVIF/WebP variants
+Scans the rendered page and the JS/CSS bundles it loads (bag cards are built in filter_form.js), picks the
+srcset candidate a browser would at the given device pixel ratio; variants are built on demand.
+
+    python benchmarks/bench_page_weight.py --dpr 2 --format image/avif
+"""
+
+import argparse
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from flask import render_template
+import filter_bag_app as fba
+
+app = fba.create_app()
+
+
+def pick_candidate(srcset, css_px, dpr):
+    candidates = sorted((int(w[:-1]), url) for url, w in (item.split() for item in srcset.split(', ')))
+    for width, url in candidates:
+        if width >= css_px * dpr:
+            return url
+    return candidates[-1][1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Client form image weight')
+    parser.add_argument('--dpr', type=float, default=2)
+    parser.add_argument('--format', default='image/avif', choices=['image/avif', 'image/webp'])
+    args = parser.parse_args()
+
+    with app.test_request_context('/'):
+        html = render_template('filter_form.html', token='abc', recipient_email='client@example.com',
+                               po_number='PO-1', admin_quantity=50, admin_size='150mm x 120mm')
+    client = app.test_client()
+
+    # Page + jo bundles woh load karta hai — image_tag() calls bundle sources mein bhi hain
+    sources = {filename: name for name, filename in fba.BUNDLES.items()}
+    bundles = re.findall(r'/assets/([^"]+\.(?:js|css))"', html)
+    templates = [fba.TEMPLATES['filter_form.html']]
+    loaded = [html]
+    for filename in bundles:
+        with open(os.path.join(fba.ASSET_SOURCE_DIR, sources[filename]), encoding='utf-8') as fh:
+            templates.append(fh.read())
+        loaded.append(client.get(f'/assets/{filename}').get_data(as_text=True))
+    names = dict.fromkeys(name for source in templates for name in re.findall(r"image_tag\('([^']+)'", source))
+    before = sum(os.path.getsize(os.path.join(fba.STATIC_DIR, name)) for name in names)
+
+    chosen = {}
+    for picture in re.findall(r'<picture>(.*?)</picture>', ''.join(loaded)):
+        source = re.search(rf'<source type="{args.format}" srcset="([^"]+)" sizes="([^"]+)"', picture)
+        css_px = int(re.search(r'(\d+)px$', source.group(2)).group(1))
+        url = pick_candidate(source.group(1), css_px, args.dpr)
+        chosen[url] = len(client.get(url).data)   # same URL twice = one download (browser cache)
+
+    after = sum(chosen.values())
+    print(f"{'scanned':<10} filter_form.html + {', '.join(sources[filename] for filename in bundles)}")
+    print(f"{'images':<10} {len(names)} unique sources, {len(chosen)} downloads")
+    for url, size in chosen.items():
+        print(f"  {url:<40} {size:>8,} B")
+    print(f"{'before':<10} {before:>10,} B")
+    print(f"{'after':<10} {after:>10,} B   ({before / after:.1f}x smaller, {args.format} @ {args.dpr}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Resend client benchmark - pooled keep-alive session vs. one-off requests.post
+Runs fully offline against benchmarks/fake_resend.py (HTTPS by default, so handshakes are counted).
+
+    python benchmarks/bench_resend_client.py --emails 200 --latency-ms 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_resend import start_fake_resend
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pooled vs unpooled Resend client')
+    parser.add_argument('--emails', type=int, default=200)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--no-tls', action='store_true')
+    args = parser.parse_args()
+
+    server, url, certfile = start_fake_resend(latency=args.latency_ms / 1000, tls=not args.no_tls)
+    if certfile:
+        os.environ['REQUESTS_CA_BUNDLE'] = certfile
+    os.environ['RESEND_API_URL'] = url
+    os.environ.setdefault('DATABASE_URL', 'sqlite://')
+    os.environ.setdefault('SENDER_EMAIL', 'bench@example.com')
+
+    import requests
+    import filter_bag_app as fba
+
+    html = '<p>' + 'x' * 2000 + '</p>'
+
+    def unpooled():
+        r = requests.post(f'{url}/emails', json={
+            'from': f'Vaayushanti <{fba.SENDER_EMAIL}>', 'to': ['client@example.com'],
+            'subject': 'Benchmark', 'html': html
+        }, headers={'Authorization': 'Bearer x', 'Content-Type': 'application/json'}, timeout=10)
+        return r.status_code == 200
+
+    def pooled():
+        return fba.send_email_resend('client@example.com', 'Benchmark', html)
+
+    # send_email_resend prints every response; keep the report readable
+    devnull = open(os.devnull, 'w')
+    results = {}
+    for name, fn in (('unpooled', unpooled), ('pooled', pooled)):
+        server.reset_stats()
+        real_stdout, sys.stdout = sys.stdout, devnull
+        try:
+            start = time.perf_counter()
+            ok = sum(fn() for _ in range(args.emails))
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = real_stdout
+        results[name] = (elapsed, ok, server.stats['connections'])
+
+    print(f"{'path':<10} {'emails':>7} {'ok':>5} {'conns':>6} {'total s':>9} {'ms/email':>9}")
+    for name, (elapsed, ok, conns) in results.items():
+        print(f"{name:<10} {args.emails:>7} {ok:>5} {conns:>6} {elapsed:>9.3f} {elapsed / args.emails * 1000:>9.2f}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Page render benchmark - render_template_string (re-compiled per call) vs. the precompiled registry
+Renders each admin/client page inside a request context, no database needed.
+
+    python benchmarks/bench_templates.py --iterations 300
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from flask import render_template, render_template_string
+import filter_bag_app as fba
+
+app = fba.create_app()
+
+
+def sample_link(i=0):
+    now = datetime.utcnow()
+    return SimpleNamespace(
+        id=i, token=f'tok{i}', recipient_email=f'client{i}@example.com', po_number=f'PO-{i}',
+        admin_quantity=50, admin_size='150mm x 120mm', status='submitted', created_at=now, submitted_at=now
+    )
+
+
+def sample_submissions(count):
+    now = datetime.utcnow()
+    return [SimpleNamespace(
+        id=i, form_link_id=i, bag_type=('collar', 'snap', 'ring')[i % 3],
+        collar_od='150mm', collar_id='140mm', tubesheet_data='TS-1', tubesheet_dia='160mm',
+        client_name=f'Client {i}', client_email=f'client{i}@example.com', quantity=50,
+        remarks='Urgent', superseded=bool(i % 4 == 0), created_at=now, submitted_at=now
+    ) for i in range(count)]
+
+
+def bench(fn, iterations):
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Template render benchmark')
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--rows', type=int, default=10, help='submission cards on /submissions')
+    args = parser.parse_args()
+
+    pages = {
+        'login.html':       {'error': None},
+        'sender.html':      {},
+        'filter_form.html': {'token': 'abc', 'recipient_email': 'client@example.com', 'po_number': 'PO-1',
+                             'admin_quantity': 50, 'admin_size': '150mm x 120mm'},
+        'submissions.html': {'cards': [(sample_link(bag.id), bag) for bag in sample_submissions(args.rows)],
+                             'next_cursor': None, 'page_size': args.rows, 'export_args': {},
+                             'filters': {'po': '', 'client': '', 'bag_type': '', 'status': '', 'from': '', 'to': ''}},
+    }
+
+    print(f"{'page':<18} {'string µs':>10} {'compiled µs':>12} {'speedup':>8}")
+    with app.test_request_context('/'):
+        for name, ctx in pages.items():
+            source = fba.TEMPLATES[name]
+            before = bench(lambda: render_template_string(source, **ctx), args.iterations)
+            after  = bench(lambda: render_template(name, **ctx), args.iterations)
+            print(f"{name:<18} {before:>10.1f} {after:>12.1f} {before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
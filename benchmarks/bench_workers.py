@@ -0,0 +1,114 @@
+"""
+Concurrent submit throughput - gunicorn sync workers vs. gthread workers (same process count)
+Each request POSTs a bag spec to its own /api/submit-form/<token>. --db-rtt-ms adds a sleep before
+every SQL statement to stand in for the network round trip to a remote Postgres (0 = local SQLite speed).
+SQLite takes one write lock per database, so writes serialise there; use --database-url for Postgres.
+
+    python benchmarks/bench_workers.py --workers 2 --threads 4 --concurrency 16 --requests 400 --db-rtt-ms 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_cold_start import free_port, wait_for
+
+
+def latency_app():
+    """gunicorn entry point: the real app plus a fake DB round trip per statement."""
+    from sqlalchemy import event
+    import filter_bag_app as fba
+
+    app = fba.create_app()
+    rtt = float(os.environ.get('BENCH_DB_RTT_MS', 0)) / 1000
+    if rtt:
+        with app.app_context():
+            event.listen(fba.db.engine, 'before_cursor_execute', lambda *args: time.sleep(rtt))
+    return app
+
+
+def create_links(env, count):
+    code = ('import secrets, filter_bag_app as f; app = f.create_app()\n'
+            'with app.app_context():\n'
+            '    links = [f.FormLink(token=secrets.token_urlsafe(16), recipient_email="c@example.com",'
+            ' admin_quantity=10, admin_size="150mm x 120mm") for _ in range(%d)]\n'
+            '    f.db.session.add_all(links); f.db.session.commit()\n'
+            '    print("\\n".join(l.token for l in links))' % count)
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def submit(base, token):
+    body = json.dumps({'bags': [{'bag_type': 'collar', 'collar_od': '150', 'collar_id': '120',
+                                 'client_name': 'Bench', 'client_email': 'c@example.com'}]}).encode()
+    req = urllib.request.Request(f'{base}/api/submit-form/{token}', data=body,
+                                 headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=60) as response:
+            ok = response.status == 200
+    except OSError:
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def run(args, env, worker_class, threads, tokens):
+    port = free_port()
+    cmd = [sys.executable, '-m', 'gunicorn', 'bench_workers:latency_app()', '--pythonpath', f'{ROOT},{ROOT}/benchmarks',
+           '--bind', f'127.0.0.1:{port}', '--workers', str(args.workers), '--worker-class', worker_class,
+           '--threads', str(threads), '--preload', '--log-level', 'warning', '--config', '/dev/null']
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=dict(env, DB_POOL_SIZE=str(threads)),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f'http://127.0.0.1:{port}'
+        if not wait_for(f'{base}/admin/login', time.perf_counter() + 60):
+            raise SystemExit(f'gunicorn ({worker_class}) did not start')
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.concurrency) as pool:
+            results = list(pool.map(lambda token: submit(base, token), tokens))
+        elapsed = time.perf_counter() - start
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies = sorted(t for ok, t in results if ok)
+    failed = sum(1 for ok, _ in results if not ok)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    label = f'{worker_class} {args.workers}x{threads}'
+    print(f"{label:<14} {len(latencies) / elapsed:>8.1f} {statistics.median(latencies) * 1000 if latencies else 0:>8.0f} "
+          f"{p95 * 1000:>8.0f} {failed:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent submit throughput, sync vs gthread')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=4, help='threads per gthread worker')
+    parser.add_argument('--concurrency', type=int, default=16, help='client connections in flight')
+    parser.add_argument('--requests', type=int, default=400, help='submits per worker class')
+    parser.add_argument('--db-rtt-ms', type=float, default=5)
+    parser.add_argument('--database-url', help='default: a throwaway SQLite file')
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_workers.db')}?timeout=60"
+    env = dict(os.environ, DATABASE_URL=url, BENCH_DB_RTT_MS=str(args.db_rtt_ms))
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'filter_bag_app', 'db-upgrade'],
+                   cwd=ROOT, env=env, capture_output=True, check=True)
+
+    print(f"{args.requests} submits, {args.concurrency} concurrent, db rtt {args.db_rtt_ms:g} ms")
+    print(f"{'workers':<14} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'failed':>7}")
+    run(args, env, 'sync', 1, create_links(env, args.requests))
+    run(args, env, 'gthread', args.threads, create_links(env, args.requests))
+
+
+if __name__ == '__main__':
+    main()
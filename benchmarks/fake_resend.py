@@ -0,0 +1,140 @@
+"""
+Fake Resend API - local stand-in for api.resend.com
+Serves POST /emails and /emails/batch with keep-alive, optional TLS, configurable latency and error rate.
+
+Run standalone:  python benchmarks/fake_resend.py --port 8025 --latency-ms 40
+Then point the app at it:  RESEND_API_URL=http://127.0.0.1:8025
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import random
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import os
+
+
+class FakeResendHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive, same as the real API
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.stats_lock:
+            self.server.stats['connections'] += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        server = self.server
+        with server.stats_lock:
+            server.stats['requests'] += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        roll = random.random()
+        if roll < server.rate_limit_rate:
+            with server.stats_lock:
+                server.stats['rate_limited'] += 1
+            return self._reply(429, {'name': 'rate_limit_exceeded'}, {'Retry-After': '1'})
+        if roll < server.rate_limit_rate + server.error_rate:
+            with server.stats_lock:
+                server.stats['errors'] += 1
+            return self._reply(500, {'name': 'internal_server_error'})
+
+        if self.path == '/emails':
+            with server.stats_lock:
+                server.stats['emails'] += 1
+            return self._reply(200, {'id': f'fake-{random.getrandbits(48):x}'})
+        if self.path == '/emails/batch':
+            # Real API validates the whole batch up front and rejects it as a unit
+            if not isinstance(payload, list) or len(payload) > 100 or \
+                    any('@' not in ''.join(m.get('to', [])) for m in payload):
+                return self._reply(422, {'name': 'validation_error'})
+            with server.stats_lock:
+                server.stats['batches'] += 1
+                server.stats['emails'] += len(payload)
+            return self._reply(200, {'data': [{'id': f'fake-{random.getrandbits(48):x}'} for _ in payload]})
+        return self._reply(404, {'name': 'not_found'})
+
+
+class FakeResendServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, error_rate=0.0, rate_limit_rate=0.0):
+        super().__init__(address, FakeResendHandler)
+        self.latency         = latency
+        self.error_rate      = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stats_lock      = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {'connections': 0, 'requests': 0, 'emails': 0, 'batches': 0, 'errors': 0, 'rate_limited': 0}
+
+
+def make_self_signed_cert():
+    """Create a throwaway localhost certificate; returns (certfile, keyfile)."""
+    tmp = tempfile.mkdtemp(prefix='fake-resend-')
+    cert, key = os.path.join(tmp, 'cert.pem'), os.path.join(tmp, 'key.pem')
+    subprocess.run([
+        'openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+        '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost,IP:127.0.0.1',
+        '-keyout', key, '-out', cert
+    ], check=True, capture_output=True)
+    return cert, key
+
+
+def start_fake_resend(port=0, latency=0.0, error_rate=0.0, rate_limit_rate=0.0, tls=False):
+    """Start the fake server on a background thread. Returns (server, base_url, certfile)."""
+    server = FakeResendServer(('127.0.0.1', port), latency, error_rate, rate_limit_rate)
+    certfile = None
+    if tls:
+        certfile, keyfile = make_self_signed_cert()
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(certfile, keyfile)
+        server.socket = ctx.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    scheme = 'https' if tls else 'http'
+    return server, f'{scheme}://localhost:{server.server_address[1]}', certfile
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local fake Resend API')
+    parser.add_argument('--port', type=int, default=8025)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0, help='fraction of requests answered with 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help='fraction answered with 429 + Retry-After')
+    parser.add_argument('--tls', action='store_true', help='serve HTTPS with a throwaway self-signed cert')
+    args = parser.parse_args()
+
+    server, url, certfile = start_fake_resend(args.port, args.latency_ms / 1000, args.error_rate,
+                                              args.rate_limit_rate, args.tls)
+    print(f"📮 Fake Resend listening on {url}")
+    if certfile:
+        print(f"   REQUESTS_CA_BUNDLE={certfile}")
+    try:
+        while True:
+            time.sleep(5)
+            print("   stats:", server.stats)
+    except KeyboardInterrupt:
+        server.shutdown()
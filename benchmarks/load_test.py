@@ -0,0 +1,246 @@
+"""
+End-to-end load test - the whole send → fill → submit → review flow against a real gunicorn
+Boots the app (gunicorn.conf.py, so the production worker model) and the outbox worker against a
+throwaway SQLite file or --database-url, with benchmarks/fake_resend.py standing in for Resend.
+Each virtual user loops over:
+
+    admin  send_form  →  client filter_form  →  get_size_catalog  →  submit_form  →  admin view_submissions
+
+Reports p50/p95/p99 and req/s per route and writes everything to JSON; --baseline prints the change
+against an earlier run of the same command.
+
+    python benchmarks/load_test.py --users 8 --iterations 25 --output after.json --baseline before.json
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from sqlalchemy import create_engine, text
+
+from bench_cold_start import free_port, wait_for
+from fake_resend import start_fake_resend
+
+ROUTES = ('send_form', 'filter_form', 'get_size_catalog', 'submit_form', 'view_submissions')
+SIZES  = {'collar': ('150mm x 120mm', '160mm x 130mm'), 'snap': ('155mm x 6000mm',), 'ring': ('130mm x 3000mm',)}
+ADMIN  = {'username': 'bench-admin', 'password': 'bench-password'}
+
+
+class Recorder:
+    """Latency samples and failures per route, shared by all virtual users."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {route: [] for route in ROUTES}
+        self.failures = {route: 0 for route in ROUTES}
+        self.enabled = False
+
+    def call(self, route, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = fn(*args, timeout=60, **kwargs)
+            ok = response.status_code == 200
+        except requests.RequestException:
+            response, ok = None, False
+        elapsed = time.perf_counter() - start
+        if self.enabled:
+            with self.lock:
+                self.samples[route].append(elapsed)
+                self.failures[route] += not ok
+        if not ok:
+            raise RuntimeError(f'{route} failed ({response.status_code if response is not None else "no response"})')
+        return response
+
+
+def admin_session(base):
+    session = requests.Session()
+    response = session.post(f'{base}/admin/login', data=ADMIN, allow_redirects=False, timeout=30)
+    if response.status_code != 302:
+        raise SystemExit('admin login failed — is ADMIN_USERNAME/ADMIN_PASSWORD passed through?')
+    return session
+
+
+def virtual_user(base, recorder, user, iterations, errors):
+    admin, client = admin_session(base), requests.Session()
+    for i in range(iterations):
+        try:
+            sent = recorder.call('send_form', admin.post, f'{base}/api/send-form', json={
+                'recipient_email': f'client{user}-{i}@example.com', 'po_number': f'PO-{user}-{i}',
+                'admin_quantity': 50, 'admin_size': '150mm x 120mm'})
+            token = sent.json()['form_url'].rsplit('/', 1)[1]
+            recorder.call('filter_form', client.get, f'{base}/form/{token}')
+            recorder.call('get_size_catalog', client.get, f'{base}/api/sizes')
+            recorder.call('submit_form', client.post, f'{base}/api/submit-form/{token}', json={
+                'bags': [{'bag_type': 'collar', 'collar_od': '150', 'collar_id': '120',
+                          'client_name': f'Client {user}', 'client_email': f'client{user}-{i}@example.com'}],
+                'global_remarks': 'load test'})
+            recorder.call('view_submissions', admin.get, f'{base}/submissions', params={'po': f'PO-{user}-'})
+        except (RuntimeError, KeyError, ValueError) as e:
+            errors.append(str(e))
+
+
+def percentile(samples, pct):
+    return samples[max(0, math.ceil(pct / 100 * len(samples)) - 1)]   # nearest rank
+
+
+def summarize(recorder, elapsed):
+    routes = {}
+    for route in ROUTES:
+        samples = sorted(recorder.samples[route])
+        if not samples:
+            continue
+        routes[route] = {
+            'requests': len(samples),
+            'failures': recorder.failures[route],
+            'rps':      round(len(samples) / elapsed, 2),
+            'mean_ms':  round(statistics.fmean(samples) * 1000, 2),
+            'p50_ms':   round(percentile(samples, 50) * 1000, 2),
+            'p95_ms':   round(percentile(samples, 95) * 1000, 2),
+            'p99_ms':   round(percentile(samples, 99) * 1000, 2),
+        }
+    return routes
+
+
+def git_revision():
+    out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip() or None
+
+
+def print_report(result, baseline=None):
+    base_routes = (baseline or {}).get('routes', {})
+    header = f"{'route':<18} {'req':>6} {'fail':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    print(header + ('   Δp95     Δreq/s' if baseline else ''))
+    for route, r in result['routes'].items():
+        line = (f"{route:<18} {r['requests']:>6} {r['failures']:>5} {r['rps']:>8.1f} "
+                f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f}")
+        before = base_routes.get(route)
+        if before:
+            line += f"  {r['p95_ms'] / before['p95_ms'] - 1:>+6.0%}  {r['rps'] / before['rps'] - 1:>+8.0%}"
+        print(line)
+    print(f"\nflows/s {result['flows_per_s']:.1f}   errors {len(result['errors'])}   "
+          f"resend {result['resend']['emails']} emails in {result['resend']['requests']} calls "
+          f"({result['resend']['errors']} 5xx, {result['resend']['rate_limited']} 429)   "
+          f"outbox drained in {result['outbox_drain_s']} s")
+    if baseline:
+        print(f"baseline: {baseline['meta']['revision']} @ {baseline['meta']['started_at']}")
+
+
+def wait_for_outbox(engine, timeout=120):
+    """Seconds until the outbox worker has no pending emails left (Resend side ka kaam bhi result ka hissa hai)."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        with engine.connect() as conn:
+            if not conn.scalar(text("SELECT count(*) FROM email_outbox WHERE status = 'pending'")):
+                break
+        time.sleep(0.1)
+    return round(time.perf_counter() - start, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end load test with a fake Resend')
+    parser.add_argument('--users', type=int, default=8, help='concurrent virtual users (admin + client pair)')
+    parser.add_argument('--iterations', type=int, default=25, help='flows per user, after one warm-up flow')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn workers (WEB_CONCURRENCY)')
+    parser.add_argument('--threads', type=int, default=4, help='threads per gthread worker')
+    parser.add_argument('--database-url', help='default: a throwaway SQLite file')
+    parser.add_argument('--resend-latency-ms', type=float, default=50)
+    parser.add_argument('--resend-error-rate', type=float, default=0.0, help='fraction of Resend calls → 500')
+    parser.add_argument('--resend-rate-limit-rate', type=float, default=0.0, help='fraction of Resend calls → 429')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='earlier results JSON to compare against')
+    args = parser.parse_args()
+
+    resend, resend_url, _ = start_fake_resend(latency=args.resend_latency_ms / 1000, error_rate=args.resend_error_rate,
+                                              rate_limit_rate=args.resend_rate_limit_rate)
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'load_test.db')}?timeout=60"
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=url, PORT=str(port), RESEND_API_URL=resend_url, RESEND_API_KEY='bench',
+               SENDER_EMAIL='bench@example.com', ADMIN_USERNAME=ADMIN['username'], ADMIN_PASSWORD=ADMIN['password'],
+               WEB_CONCURRENCY=str(args.workers), GUNICORN_THREADS=str(args.threads), GUNICORN_ACCESS_LOG='/dev/null',
+               OUTBOX_POLL_SECONDS='0.2', SQL_PROFILE='0')
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'filter_bag_app', 'db-upgrade'],
+                   cwd=ROOT, env=env, capture_output=True, check=True)
+
+    procs = [
+        subprocess.Popen([sys.executable, '-m', 'gunicorn', 'filter_bag_app:create_app()', '-c', 'gunicorn.conf.py'],
+                         cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
+        subprocess.Popen([sys.executable, '-m', 'flask', '--app', 'filter_bag_app', 'outbox-worker'],
+                         cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL),
+    ]
+    base = f'http://127.0.0.1:{port}'
+    try:
+        if not wait_for(f'{base}/admin/login', time.perf_counter() + 60):
+            raise SystemExit('gunicorn did not start')
+        admin = admin_session(base)
+        for bag_type, names in SIZES.items():
+            for name in names:
+                admin.post(f'{base}/api/sizes', json={'bag_type': bag_type, 'size_name': name}, timeout=30)
+
+        recorder, errors = Recorder(), []
+        warmup = [threading.Thread(target=virtual_user, args=(base, recorder, u, 1, errors)) for u in range(args.users)]
+        for t in warmup:
+            t.start()
+        for t in warmup:
+            t.join()
+        engine = create_engine(url)
+        wait_for_outbox(engine)
+        resend.reset_stats()
+
+        recorder.enabled, errors = True, []
+        users = [threading.Thread(target=virtual_user, args=(base, recorder, 1000 + u, args.iterations, errors))
+                 for u in range(args.users)]
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        for t in users:
+            t.start()
+        for t in users:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        drain = wait_for_outbox(engine)
+        engine.dispose()
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+        resend.shutdown()
+
+    result = {
+        'meta': {
+            'revision':   git_revision(),
+            'started_at': started_at.isoformat(timespec='seconds') + 'Z',
+            'database':   url.split(':', 1)[0],
+            'args':       {k: v for k, v in vars(args).items() if k not in ('output', 'baseline', 'database_url')},
+            'duration_s': round(elapsed, 2),
+        },
+        'flows_per_s':    round(args.users * args.iterations / elapsed, 2),
+        'routes':         summarize(recorder, elapsed),
+        'errors':         errors[:20],
+        'resend':         dict(resend.stats),
+        'outbox_drain_s': drain,
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+    print_report(result, baseline)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(result, fh, indent=2)
+        print(f"results → {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Micro-benchmarks - CPU hot paths of filter_bag_app.py on fixed datasets, with a regression gate
+Every case runs in-process against an in-memory SQLite, warmed once, gc off while timing. Calls are
+auto-calibrated so one round takes about --min-time; the best round of --rounds is the score
+(least sensitive to noise, same as pytest-benchmark's "min").
+
+    python benchmarks/microbench.py --output baseline.json
+    python benchmarks/microbench.py --baseline baseline.json --threshold 0.15   # exit 1 on regression
+
+Baselines are only comparable on the same machine and Python.
+"""
+
+import argparse
+import fnmatch
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['DATABASE_URL'] = 'sqlite://'   # hamesha in-memory — local DATABASE_URL se koi farak nahi
+os.environ['SQL_PROFILE'] = '0'
+
+from flask import render_template
+import filter_bag_app as fba
+from bench_templates import app, sample_link, sample_submissions
+
+FORM_LINKS = 10_000   # token lookup dataset
+SIZES_PER_TYPE = 200
+
+
+def form_context():
+    return {'token': 'abc', 'recipient_email': 'client@example.com', 'po_number': 'PO-1',
+            'admin_quantity': 50, 'admin_size': '150mm x 120mm'}
+
+
+def submissions_context(rows):
+    return {'cards': [(sample_link(bag.id), bag) for bag in sample_submissions(rows)],
+            'next_cursor': 'x', 'page_size': rows, 'export_args': {},
+            'filters': {'po': '', 'client': '', 'bag_type': '', 'status': '', 'from': '', 'to': ''}}
+
+
+def seed_database():
+    """Fixed rows: FORM_LINKS links with deterministic tokens, SIZES_PER_TYPE sizes per bag type."""
+    fba.run_migrations()
+    fba.db.session.execute(fba.FormLink.__table__.insert(), [
+        {'token': f'token-{i:06d}', 'recipient_email': f'client{i}@example.com', 'po_number': f'PO-{i}',
+         'admin_quantity': 50, 'admin_size': '150mm x 120mm', 'status': 'pending'} for i in range(FORM_LINKS)])
+    fba.db.session.execute(fba.BagSize.__table__.insert(), [
+        {'bag_type': bag_type, 'size_name': f'{100 + i}mm x {3000 + i}mm'}
+        for bag_type in fba.BAG_TYPES for i in range(SIZES_PER_TYPE)])
+    fba.db.session.commit()
+    fba.invalidate_size_cache()
+
+
+def cases():
+    """name → zero-argument callable. Each runs inside one app + request context."""
+    link, bags = sample_link(1), sample_submissions(10)
+    tokens = [f'token-{i:06d}' for i in random.Random(0).sample(range(FORM_LINKS), 1000)]
+    lookups = itertools.cycle(tokens)
+    pages = {rows: submissions_context(rows) for rows in (10, 1_000, 10_000)}
+    return {
+        'render.filter_form':          lambda: render_template('filter_form.html', **form_context()),
+        'render.submissions.10':       lambda: render_template('submissions.html', **pages[10]),
+        'render.submissions.1k':       lambda: render_template('submissions.html', **pages[1_000]),
+        'render.submissions.10k':      lambda: render_template('submissions.html', **pages[10_000]),
+        'email.submission_admin.1':    lambda: fba.build_submission_notification(link, bags[:1]),
+        'email.submission_admin.10':   lambda: fba.build_submission_notification(link, bags),
+        'email.submission_client.10':  lambda: fba.build_client_submission_notification(link, bags),
+        'json.get_sizes':              lambda: fba.get_sizes('collar').get_data(),
+        'json.get_size_catalog':       lambda: fba.get_size_catalog().get_data(),
+        'db.get_form_link':            lambda: fba.get_form_link(next(lookups)),
+    }
+
+
+def measure(fn, rounds, min_time):
+    """Best and median seconds per call over `rounds` calibrated rounds."""
+    fn()
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < 0.02:
+        fn()
+        calls += 1
+    loops = max(1, round(min_time / ((time.perf_counter() - start) / calls)))
+
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            timings.append((time.perf_counter() - start) / loops)
+    finally:
+        gc.enable()
+    return {'min_us': round(min(timings) * 1e6, 2), 'median_us': round(statistics.median(timings) * 1e6, 2),
+            'loops': loops, 'rounds': rounds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot-path micro-benchmarks with a regression gate')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per round (approx)')
+    parser.add_argument('-k', '--select', default='*', help='glob over case names, e.g. "render.*"')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--baseline', help='earlier results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.15, help='allowed slowdown of min_us (0.15 = 15%%)')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)['cases']
+
+    results, regressions = {}, []
+    with app.test_request_context('/'):
+        seed_database()
+        print(f"{'case':<28} {'min µs':>10} {'median µs':>10} {'loops':>7}" + ('   baseline    change' if baseline else ''))
+        for name, fn in cases().items():
+            if not fnmatch.fnmatch(name, args.select):
+                continue
+            r = results[name] = measure(fn, args.rounds, args.min_time)
+            line = f"{name:<28} {r['min_us']:>10.1f} {r['median_us']:>10.1f} {r['loops']:>7}"
+            before = baseline.get(name)
+            if before:
+                change = r['min_us'] / before['min_us'] - 1
+                line += f"  {before['min_us']:>10.1f}  {change:>+7.1%}"
+                if change > args.threshold:
+                    regressions.append(name)
+                    line += '  ❌ REGRESSION'
+            print(line)
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'cases': results}, fh, indent=2)
+        print(f"results → {args.output}")
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Page size report - per-request HTML bytes with inline CSS/JS (before) vs. external hashed bundles (after)
+"Before" re-inlines each bundle's unminified source in place of its <link>/<script src>, i.e. what every
+page view used to download. Bundles are listed separately: fetched once, then served from browser cache.
+
+    python benchmarks/report_page_size.py --rows 10
+"""
+
+import argparse
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from flask import render_template
+import filter_bag_app as fba
+from bench_templates import app, sample_link, sample_submissions
+
+
+def inline_source(name):
+    with open(os.path.join(fba.ASSET_SOURCE_DIR, name), encoding='utf-8') as fh:
+        return app.jinja_env.from_string(fh.read()).render()
+
+
+def reinline(html):
+    by_url = {fba.asset_url(name): name for name in fba.BUNDLES}
+    html = re.sub(r'<link rel="stylesheet" href="([^"]+)">',
+                  lambda m: f'<style>\n{inline_source(by_url[m.group(1)])}\n</style>', html)
+    return re.sub(r'<script src="([^"]+)"></script>',
+                  lambda m: f'<script>\n{inline_source(by_url[m.group(1)])}\n</script>', html)
+
+
+def sample_pages(rows):
+    """Template name → render context for every full page."""
+    return {
+        'login.html':       {'error': None},
+        'sender.html':      {},
+        'filter_form.html': {'token': 'abc', 'recipient_email': 'client@example.com', 'po_number': 'PO-1',
+                             'admin_quantity': 50, 'admin_size': '150mm x 120mm'},
+        'submissions.html': {'cards': [(sample_link(bag.id), bag) for bag in sample_submissions(rows)],
+                             'next_cursor': None, 'page_size': rows, 'export_args': {},
+                             'filters': {'po': '', 'client': '', 'bag_type': '', 'status': '', 'from': '', 'to': ''}},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-page HTML size report')
+    parser.add_argument('--rows', type=int, default=10, help='submission cards on /submissions')
+    args = parser.parse_args()
+
+    pages = sample_pages(args.rows)
+
+    print(f"{'page':<18} {'before B':>10} {'after B':>10} {'saved':>7}")
+    with app.test_request_context('/'):
+        for name, ctx in pages.items():
+            after = render_template(name, **ctx)
+            before = reinline(after)
+            a, b = len(after.encode()), len(before.encode())
+            print(f"{name:<18} {b:>10,} {a:>10,} {1 - a / b:>6.0%}")
+
+    print(f"\n{'bundle (cached)':<34} {'source B':>10} {'min B':>8}")
+    for name, filename in sorted(fba.BUNDLES.items()):
+        source = len(inline_source(name).encode())
+        size = os.path.getsize(os.path.join(fba.ASSET_DIST_DIR, filename))
+        print(f"{filename:<34} {source:>10,} {size:>8,}")
+
+
+if __name__ == '__main__':
+    main()
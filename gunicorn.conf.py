@@ -0,0 +1,122 @@
+"""
+Gunicorn config — `gunicorn 'filter_bag_app:create_app()'` isko cwd se khud load karta hai.
+
+Worker class default gthread hai: request handlers DB pe wait karte hain (emails outbox se jaate hain),
+toh ek process mein kai threads I/O overlap karte hain. Worker count CPU aur memory dono se nikalta hai —
+jo kam ho. Threads DB connection budget (DB_MAX_CONNECTIONS) se: workers × threads kabhi budget se upar
+nahi, aur har worker ka pool utna hi bada jitne threads. Har value env se override ho sakti hai
+(WEB_CONCURRENCY, GUNICORN_THREADS, DB_POOL_SIZE, ...), par budget ke andar clamp hoti hai.
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+
+def env_int(name, default):
+    return int(os.environ.get(name) or default)
+
+
+def memory_limit_mb():
+    """Container memory limit (cgroup v2/v1), else MemAvailable. None if unknown."""
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as fh:
+                value = fh.read().strip()
+            if value != 'max' and int(value) < 1 << 60:
+                return int(value) // (1024 * 1024)
+        except (OSError, ValueError):
+            pass
+    try:
+        with open('/proc/meminfo') as fh:
+            for line in fh:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+WORKER_MEMORY_MB = env_int('GUNICORN_WORKER_MEMORY_MB', 150)   # ek worker ka RSS (preload ke baad, approx)
+MEMORY_RESERVE_MB = env_int('GUNICORN_MEMORY_RESERVE_MB', 128)  # master + outbox worker ke liye
+
+
+def default_workers():
+    by_cpu = multiprocessing.cpu_count() * 2 + 1
+    memory = memory_limit_mb()
+    if memory is None:
+        return by_cpu
+    return max(1, min(by_cpu, (memory - MEMORY_RESERVE_MB) // WORKER_MEMORY_MB))
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# gthread: stdlib threads, koi extra dependency nahi. gevent ke liye `gevent` + `psycogreen` install karo
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+worker_connections = env_int('GUNICORN_WORKER_CONNECTIONS', 100)   # gevent: greenlets per worker
+
+# Is web dyno ke saare workers mil ke itne DB connections le sakte hain — DB/pgbouncer ki limit
+# (pgbouncer default_pool_size 20 hai). Outbox worker alag process hai, uska pool isme nahi.
+DB_MAX_CONNECTIONS = env_int('DB_MAX_CONNECTIONS', 20)
+workers = min(env_int('WEB_CONCURRENCY', default_workers()), DB_MAX_CONNECTIONS)
+connections_per_worker = DB_MAX_CONNECTIONS // workers
+
+# Har thread ko apna DB connection chahiye, warna pool pe queue lagti hai (/api/db-pool dekho).
+# threads = GUNICORN_THREADS (default 8), DB_POOL_SIZE aur budget mein jo sabse kam
+if worker_class == 'gthread':
+    threads = min(env_int('GUNICORN_THREADS', 8), env_int('DB_POOL_SIZE', connections_per_worker),
+                  connections_per_worker)
+    pool_size = threads
+else:
+    threads = 1
+    pool_size = min(env_int('DB_POOL_SIZE', connections_per_worker), connections_per_worker)   # greenlets share it
+os.environ['DB_POOL_SIZE'] = str(pool_size)
+# Overflow bhi budget mein — pool_size + max_overflow per worker, × workers ≤ DB_MAX_CONNECTIONS
+os.environ['DB_MAX_OVERFLOW'] = str(min(env_int('DB_MAX_OVERFLOW', 0), connections_per_worker - pool_size))
+
+# Parent ek baar import + create_app karta hai, workers warm fork hote hain
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+keepalive = env_int('GUNICORN_KEEPALIVE', 5)              # LB idle timeout se kam rakho
+timeout = env_int('GUNICORN_TIMEOUT', 30)                 # itna atka worker kill + restart
+graceful_timeout = env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)   # deploy/restart pe in-flight requests ko itna time
+max_requests = env_int('GUNICORN_MAX_REQUESTS', 1000)     # slow leaks se bachne ke liye periodic recycle
+max_requests_jitter = env_int('GUNICORN_MAX_REQUESTS_JITTER', 100)   # sab workers ek saath restart na hon
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+
+# Prometheus multiprocess mode — app import se pehle set hona chahiye (config preload se pehle load hota hai).
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR',
+                      os.path.join(tempfile.gettempdir(), f"filter-bag-metrics-{os.environ.get('PORT', '8000')}"))
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+
+def on_starting(server):
+    # Sirf master, workers fork hone se pehle: pichhle run ki files saaf, taaki purane counters na jude.
+    # Config import pe nahi — `--check-config` ya dusra process live workers ki files na mita de.
+    if 'GUNICORN_PID' in os.environ:
+        return   # USR2 re-exec: purana master aur uske workers abhi chal rahe hain
+    metrics_dir = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    for name in os.listdir(metrics_dir):
+        os.remove(os.path.join(metrics_dir, name))
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        # psycopg2 C-level calls gevent hub ko block karti hain — wait callback patch karo
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+    # Parent ke (agar koi) pooled connections child mein reuse nahi hone chahiye
+    app = getattr(server.app, 'callable', None)
+    if app is not None and 'sqlalchemy' in getattr(app, 'extensions', {}):
+        from filter_bag_app import db
+        with app.app_context():
+            db.engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    # Mare hue worker ki live gauges (pool in-use) total se hatao
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
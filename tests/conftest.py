@@ -0,0 +1,65 @@
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')   # import-time default; har test apni file DB deta hai
+os.environ['SQL_PROFILE'] = '0'
+
+import pytest
+from sqlalchemy import event
+
+import filter_bag_app as fba
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = fba.create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}"})
+    with app.app_context():
+        fba.run_migrations()
+    yield app
+    with app.app_context():
+        fba.db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin(app):
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['admin_logged_in'] = True
+    return client
+
+
+@pytest.fixture
+def make_link(app):
+    def make_link(**values):
+        with app.app_context():
+            link = fba.FormLink(token=values.pop('token', fba.secrets.token_urlsafe(16)),
+                                recipient_email=values.pop('recipient_email', 'client@example.com'),
+                                admin_quantity=50, admin_size='150mm x 120mm', **values)
+            fba.db.session.add(link)
+            fba.db.session.commit()
+            return link.token
+    return make_link
+
+
+@pytest.fixture
+def statements(app):
+    """Context manager recording every SQL statement the app engine runs (executemany counts once)."""
+    @contextmanager
+    def record():
+        seen = []
+        listener = lambda conn, cursor, statement, *args: seen.append(statement)
+        with app.app_context():
+            engine = fba.db.engine
+        event.listen(engine, 'before_cursor_execute', listener)
+        try:
+            yield seen
+        finally:
+            event.remove(engine, 'before_cursor_execute', listener)
+    return record
@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize('quantity', [[1], {'n': 1}, 2.7, '2.7', True, '-3', 'abc'])
+def test_malformed_quantity_marks_row_invalid(admin, quantity):
+    response = admin.post('/api/send-form/bulk', json={'admin_size': '150mm', 'recipients': [
+        {'recipient_email': 'bad@example.com', 'admin_quantity': quantity},
+        {'recipient_email': 'good@example.com', 'admin_quantity': '40'},
+    ]})
+    assert response.status_code == 200
+    bad, good = response.get_json()['results']
+    assert (bad['status'], bad['message']) == ('invalid', 'Quantity must be a valid positive number')
+    assert good['status'] == 'queued'
+
+
+def test_whole_number_quantities_are_accepted(admin):
+    response = admin.post('/api/send-form/bulk', json={'admin_size': '150mm', 'recipients': [
+        {'recipient_email': 'a@example.com', 'admin_quantity': 12},
+        {'recipient_email': 'b@example.com', 'admin_quantity': ' 7 '},
+    ]})
+    assert response.status_code == 200
+    assert response.get_json()['queued'] == 2
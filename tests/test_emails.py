@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+import filter_bag_app as fba
+
+
+def sample(**bag):
+    link = SimpleNamespace(token='tok', po_number='PO<1>', admin_quantity=5, admin_size='10" x 5"')
+    bag = SimpleNamespace(**{'bag_type': 'collar', 'collar_od': None, 'collar_id': '2', 'tubesheet_data': None,
+                             'tubesheet_dia': None, 'client_name': '<script>x</script>', 'client_email': 'a@x.com',
+                             'quantity': 5, 'remarks': 'R&D', 'submitted_at': None, **bag})
+    return link, [bag]
+
+
+def test_client_values_are_escaped(app):
+    link, bags = sample()
+    with app.test_request_context('/'):
+        _, admin = fba.build_submission_notification(link, bags)
+        _, client = fba.build_client_submission_notification(link, bags)
+    assert '<script>' not in admin and '&lt;script&gt;x&lt;/script&gt;' in admin
+    for html in (admin, client):
+        assert 'PO&lt;1&gt;' in html and '10&quot; x 5&quot;' in html and 'R&amp;D' in html
+        assert '<td><strong>Collar OD:</strong></td><td>N/A</td>' in html
+    assert 'href="http://localhost/form/tok"' in client
+
+
+def test_form_email_links_each_token(app):
+    with app.test_request_context('/'):
+        bodies = [fba.build_form_email(token, 'PO-1')[1] for token in ('a1', 'b2')]
+    assert 'href="http://localhost/form/a1"' in bodies[0] and 'href="http://localhost/form/b2"' in bodies[1]
@@ -0,0 +1,43 @@
+import csv
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from test_form_link import BAG
+
+FORMULAS = {'client_name': '=HYPERLINK("http://evil.example","x")', 'tubesheet_data': '@SUM(A1)',
+            'collar_id': '-2+3', 'remarks': '+1+1'}
+
+
+def exported(admin, fmt):
+    """Export rows as {header: cell} — CSV cells are strings, XLSX cells are openpyxl Cell objects."""
+    response = admin.get(f'/submissions/export.{fmt}?status=all')
+    assert response.status_code == 200
+    if fmt == 'csv':
+        rows = list(csv.reader(io.StringIO(response.data.decode('utf-8-sig'))))
+        return [dict(zip(rows[0], row)) for row in rows[1:]]
+    header, *rows = load_workbook(io.BytesIO(response.data)).active.iter_rows()
+    return [dict(zip((cell.value for cell in header), row)) for row in rows]
+
+
+@pytest.fixture
+def formula_submission(client, make_link):
+    response = client.post(f'/api/submit-form/{make_link()}',
+                           json={'bags': [dict(BAG, **FORMULAS)], 'global_remarks': FORMULAS['remarks']})
+    assert response.status_code == 200
+
+
+def test_csv_formula_cells_are_quoted(admin, formula_submission):
+    [row] = exported(admin, 'csv')
+    for field, value in FORMULAS.items():
+        assert row[field] == "'" + value, field
+    assert row['client_email'] == BAG['client_email']   # baaki values jaisi thi waisi
+
+
+def test_xlsx_keeps_values_and_stores_them_as_text(admin, formula_submission):
+    [row] = exported(admin, 'xlsx')
+    for field, value in FORMULAS.items():
+        assert row[field].value == value, field
+        assert row[field].data_type == 's', field   # formula nahi
+    assert row['client_email'].value == BAG['client_email']
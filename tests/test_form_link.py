@@ -0,0 +1,64 @@
+import pytest
+
+import filter_bag_app as fba
+
+BAG = {'bag_type': 'collar', 'collar_od': '150', 'collar_id': '120',
+       'client_name': 'Client', 'client_email': 'client@example.com'}
+
+
+def submit(client, token, bags=(BAG,)):
+    response = client.post(f'/api/submit-form/{token}', json={'bags': list(bags), 'global_remarks': 'test'})
+    assert response.status_code == 200, response.get_json()
+    return response
+
+
+def test_form_page_is_one_token_lookup(client, make_link, statements):
+    token = make_link()
+    with statements() as seen:
+        assert client.get(f'/form/{token}').status_code == 200
+    assert len(seen) == 1
+    assert 'FROM form_links' in seen[0] and 'token' in seen[0]
+
+
+def test_unknown_token_is_one_lookup(client, statements):
+    with statements() as seen:
+        assert client.get('/form/nope').status_code == 404
+    assert len(seen) == 1
+
+
+def test_submit_statement_count_does_not_grow_with_history(client, make_link, statements):
+    token = make_link()
+    with statements() as first:
+        submit(client, token)
+    for _ in range(20):
+        submit(client, token)
+    with statements() as later:
+        submit(client, token)
+
+    # link lookup (FOR UPDATE), supersede UPDATE, bag INSERT, outbox INSERT, link UPDATE — history se independent
+    assert len(later) == len(first) == 5
+    assert sum('FROM form_links' in s for s in later) == 1
+    assert sum(s.startswith('UPDATE filter_bag_submissions') for s in later) == 1
+
+
+def test_mixed_bag_types_are_one_insert(client, make_link, statements):
+    bags = [{'bag_type': 'collar', 'collar_od': str(i), 'collar_id': '120'} if i % 3 == 0 else
+            {'bag_type': 'snap', 'tubesheet_data': 'ring'} if i % 3 == 1 else
+            {'bag_type': 'ring', 'tubesheet_dia': '900', 'client_name': 'Client'} for i in range(50)]
+    token = make_link()
+    with statements() as seen:
+        response = submit(client, token, bags)
+    assert response.get_json()['bags_count'] == 50
+    assert sum(s.startswith('INSERT INTO filter_bag_submissions') for s in seen) == 1
+
+    with client.application.app_context():
+        stored = fba.FilterBagSubmission.query.order_by(fba.FilterBagSubmission.id).all()
+    assert [(b.bag_type, b.collar_od, b.tubesheet_dia) for b in stored] == \
+        [(bag['bag_type'], bag.get('collar_od'), bag.get('tubesheet_dia')) for bag in bags]
+
+
+@pytest.mark.parametrize('value', [{'a': 1}, ['x'], 150, True])
+def test_non_text_field_is_rejected(client, make_link, value):
+    response = client.post(f'/api/submit-form/{make_link()}', json={'bags': [dict(BAG, collar_od=value)]})
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Bag #1: collar_od must be text'
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+CONF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'gunicorn.conf.py')
+
+
+def load_conf(monkeypatch, tmp_path, **env):
+    for name in ('WEB_CONCURRENCY', 'GUNICORN_THREADS', 'GUNICORN_WORKER_CLASS', 'DB_MAX_CONNECTIONS',
+                 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    conf = {}
+    with open(CONF) as fh:
+        exec(fh.read(), conf)
+    return conf, int(os.environ['DB_POOL_SIZE']), int(os.environ['DB_MAX_OVERFLOW'])
+
+
+@pytest.mark.parametrize('env', [
+    {},
+    {'WEB_CONCURRENCY': '3', 'GUNICORN_THREADS': '16'},
+    {'WEB_CONCURRENCY': '30', 'DB_MAX_CONNECTIONS': '10'},
+    {'WEB_CONCURRENCY': '2', 'DB_POOL_SIZE': '50', 'DB_MAX_OVERFLOW': '50'},
+    {'GUNICORN_WORKER_CLASS': 'gevent', 'WEB_CONCURRENCY': '4'},
+])
+def test_connections_stay_within_budget(monkeypatch, tmp_path, env):
+    conf, pool_size, overflow = load_conf(monkeypatch, tmp_path, **env)
+    budget = int(env.get('DB_MAX_CONNECTIONS', 20))
+    assert conf['workers'] * (pool_size + overflow) <= budget
+    assert conf['threads'] <= pool_size   # har thread ko connection
+
+
+def test_threads_follow_the_pool(monkeypatch, tmp_path):
+    conf, pool_size, _ = load_conf(monkeypatch, tmp_path, WEB_CONCURRENCY='2', DB_MAX_CONNECTIONS='40')
+    assert conf['threads'] == pool_size == 8   # GUNICORN_THREADS default, budget 20/worker
+    conf, pool_size, _ = load_conf(monkeypatch, tmp_path, WEB_CONCURRENCY='4', DB_MAX_CONNECTIONS='12')
+    assert conf['threads'] == pool_size == 3
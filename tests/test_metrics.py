@@ -0,0 +1,24 @@
+import pytest
+
+import filter_bag_app as fba
+
+
+def test_metrics_hidden_without_token(client, monkeypatch):
+    monkeypatch.setattr(fba, 'METRICS_TOKEN', None)
+    monkeypatch.setattr(fba, 'METRICS_PUBLIC', False)
+    assert client.get('/metrics').status_code == 404
+
+
+@pytest.mark.parametrize('auth, status', [(None, 401), ('Bearer wrong', 401), ('Bearer s3cret', 200)])
+def test_metrics_token(client, monkeypatch, auth, status):
+    monkeypatch.setattr(fba, 'METRICS_TOKEN', 's3cret')
+    headers = {'Authorization': auth} if auth else {}
+    assert client.get('/metrics', headers=headers).status_code == status
+
+
+def test_metrics_public_opt_in(client, monkeypatch):
+    monkeypatch.setattr(fba, 'METRICS_TOKEN', None)
+    monkeypatch.setattr(fba, 'METRICS_PUBLIC', True)
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert b'http_requests_total' in response.data
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect, text
+
+import filter_bag_app as fba
+
+# filter_bag_submissions jaisa split (migration 4) se pehle tha — parent placeholder rows bhi isi table mein
+BASELINE_SCHEMA = """
+CREATE TABLE filter_bag_submissions (
+    id INTEGER NOT NULL PRIMARY KEY,
+    token VARCHAR(100) NOT NULL,
+    recipient_email VARCHAR(200) NOT NULL,
+    po_number VARCHAR(100),
+    bag_type VARCHAR(50),
+    collar_od VARCHAR(100),
+    collar_id VARCHAR(100),
+    tubesheet_data TEXT,
+    tubesheet_dia VARCHAR(100),
+    client_name VARCHAR(200),
+    client_email VARCHAR(200),
+    quantity INTEGER,
+    delivery_date VARCHAR(50),
+    remarks TEXT,
+    submitted BOOLEAN,
+    created_at DATETIME,
+    submitted_at DATETIME,
+    admin_quantity INTEGER,
+    admin_size VARCHAR(200),
+    superseded BOOLEAN
+)
+"""
+
+CREATED   = datetime(2026, 1, 1, 9, 0)
+FIRST     = datetime(2026, 1, 2, 10, 0)
+RESUBMIT  = datetime(2026, 1, 3, 11, 0)
+
+
+@pytest.fixture
+def legacy_app(tmp_path):
+    app = fba.create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'legacy.db'}"})
+    with app.app_context():
+        with fba.db.engine.begin() as conn:
+            conn.execute(text(BASELINE_SCHEMA))
+            conn.execute(text('CREATE INDEX ix_filter_bag_submissions_token ON filter_bag_submissions (token)'))
+            conn.execute(text(
+                'INSERT INTO filter_bag_submissions (token, recipient_email, po_number, bag_type, client_name, '
+                'submitted, created_at, submitted_at, admin_quantity, admin_size, superseded) VALUES '
+                # submitted link: placeholder (submitted_at kabhi set nahi hua), superseded bag, current bag
+                "('sub', 'a@x.com', 'PO-1', NULL, NULL, 1, :created, NULL, 5, '10x10', 0), "
+                "('sub', 'a@x.com', 'PO-1', 'snap', 'Old', 1, :first, :first, 5, '10x10', 1), "
+                "('sub', 'a@x.com', 'PO-1', 'ring', 'New', 1, :resubmit, :resubmit, 5, '10x10', 0), "
+                # pending link: sirf placeholder
+                "('pend', 'b@x.com', 'PO-2', NULL, NULL, 0, :created, NULL, 3, '20x20', 0)"
+            ), {'created': CREATED, 'first': FIRST, 'resubmit': RESUBMIT})
+        fba.run_migrations()
+        yield app
+        fba.db.engine.dispose()
+
+
+def test_placeholder_rows_become_form_links(legacy_app):
+    with legacy_app.app_context():
+        links = {link.token: link for link in fba.FormLink.query}
+        assert set(links) == {'sub', 'pend'}
+
+        sub, pend = links['sub'], links['pend']
+        assert (sub.recipient_email, sub.po_number, sub.admin_quantity, sub.admin_size) == ('a@x.com', 'PO-1', 5, '10x10')
+        assert sub.status == 'submitted'
+        assert sub.submitted_at == RESUBMIT   # latest bag se backfill
+        assert pend.status == 'pending'
+        assert pend.submitted_at is None
+        assert pend.created_at == CREATED
+
+
+def test_bags_map_to_their_link_and_keep_history(legacy_app):
+    with legacy_app.app_context():
+        sub = fba.get_form_link('sub')
+        bags = fba.FilterBagSubmission.query.order_by(fba.FilterBagSubmission.id).all()
+        assert [(b.form_link_id, b.bag_type, b.client_name, b.superseded) for b in bags] == [
+            (sub.id, 'snap', 'Old', True),
+            (sub.id, 'ring', 'New', False),
+        ]
+        # Placeholder rows gaye, copied parent columns bhi
+        placeholders = fba.db.session.scalar(text('SELECT count(*) FROM filter_bag_submissions WHERE bag_type IS NULL'))
+        assert placeholders == 0
+        columns = {c['name'] for c in inspect(fba.db.engine).get_columns('filter_bag_submissions')}
+        assert not columns & {'token', 'recipient_email', 'po_number', 'admin_quantity', 'admin_size', 'submitted'}
+
+
+def test_all_migrations_recorded_once(legacy_app):
+    with legacy_app.app_context():
+        applied = fba.db.session.scalars(fba.db.select(fba.SchemaMigration.version)).all()
+        assert sorted(applied) == sorted(v for v, _, _ in fba.MIGRATIONS)
+        fba.run_migrations()   # dobara chalana no-op hai
+        assert fba.db.session.scalar(fba.db.select(fba.db.func.count()).select_from(fba.SchemaMigration)) == len(applied)
+
+
+def test_migrated_link_accepts_a_resubmit(legacy_app):
+    client = legacy_app.test_client()
+    response = client.post('/api/submit-form/sub', json={'bags': [{'bag_type': 'collar', 'collar_od': '1', 'collar_id': '2'}]})
+    assert response.status_code == 200
+    with legacy_app.app_context():
+        current = fba.FilterBagSubmission.query.filter(~fba.FilterBagSubmission.superseded).all()
+        assert [b.bag_type for b in current] == ['collar']
@@ -0,0 +1,20 @@
+import pytest
+
+import filter_bag_app as fba
+
+from test_form_link import BAG, submit
+
+
+def test_direct_link_receipt_does_not_poison_the_batch(app, client, make_link, monkeypatch):
+    monkeypatch.setattr(fba, 'SENDER_EMAIL', 'admin@example.com')
+    batches = []
+    monkeypatch.setattr(fba, 'send_batch_resend', lambda messages, idempotency_key=None: batches.append(messages) or 200)
+    monkeypatch.setattr(fba, 'send_email_resend', lambda *args, **kwargs: pytest.fail('fell back to single sends'))
+
+    submit(client, make_link(recipient_email='direct-link-generated'))
+    submit(client, make_link(recipient_email='client@example.com'))
+
+    with app.app_context():
+        assert fba.drain_outbox() == 3   # do admin copies + ek client receipt; placeholder ko kuch nahi
+        assert [to for to, _, _ in batches[0]] == ['admin@example.com', 'admin@example.com', 'client@example.com']
+        assert {item.status for item in fba.EmailOutbox.query} == {'sent'}
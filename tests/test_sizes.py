@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.mark.parametrize('bag_type', ['collar', 'co"llar', 'snap\\', 'ring™'])
+def test_size_list_etag_revalidates(client, bag_type):
+    response = client.get(f'/api/sizes/{bag_type}')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('"') and etag.count('"') == 2
+
+    again = client.get(f'/api/sizes/{bag_type}', headers={'If-None-Match': etag})
+    assert again.status_code == 304
+
+
+def test_size_list_etag_differs_per_bag_type(client):
+    etags = {client.get(f'/api/sizes/{bag_type}').headers['ETag'] for bag_type in ('collar', 'snap', 'ring')}
+    assert len(etags) == 3
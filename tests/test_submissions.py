@@ -0,0 +1,39 @@
+import re
+
+from test_form_link import BAG, submit
+
+
+def history_tokens(html):
+    return re.findall(r'class="history-btn" data-token="([^"]+)"', html)
+
+
+def page(admin, **args):
+    response = admin.get('/submissions', query_string=dict(args, partial=1))
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_history_button_once_per_link(client, admin, make_link):
+    first, second = make_link(), make_link()
+    submit(client, first, [BAG] * 3)
+    submit(client, second, [BAG] * 2)
+    submit(client, second, [BAG] * 2)   # second ki ab history bhi hai
+
+    assert history_tokens(page(admin)['html']) == [second, first]
+    assert history_tokens(page(admin, status='all')['html']) == []
+    assert history_tokens(page(admin, status='superseded')['html']) == []
+
+
+def test_history_button_not_repeated_across_pages(client, admin, make_link):
+    first, second = make_link(), make_link()
+    submit(client, first, [BAG] * 3)
+    submit(client, second, [BAG] * 2)
+
+    seen, cursor = [], None
+    while True:
+        data = page(admin, limit=1, **({'cursor': cursor} if cursor else {}))
+        seen += history_tokens(data['html'])
+        cursor = data['next_cursor']
+        if not cursor:
+            break
+    assert seen == [second, first]